@@ -12,19 +12,47 @@ if sys.stdout is None:
 if sys.stderr is None:
     sys.stderr = open(os.devnull, "w")
 
+import asyncio
 import csv
-import random
-import statistics
-import string
+import io
+import logging
+import socket
 import time
 import warnings
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass
+from itertools import repeat
+from json.encoder import encode_basestring_ascii as _json_str
 
+import dns.asyncbackend
+import dns.asyncquery
+import dns.inet
 import dns.message
 import dns.query
 import dns.rdatatype
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QBrush, QColor, QFont, QPainter, QPainterPath, QPen
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QLine,
+    QPointF,
+    QRectF,
+    QSize,
+    Qt,
+    QThread,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QPainter,
+    QPainterPath,
+    QPen,
+    QPixmap,
+    QStaticText,
+    QTransform,
+)
 from PyQt6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -32,6 +60,7 @@ from PyQt6.QtWidgets import (
     QDoubleSpinBox,
     QFileDialog,
     QFrame,
+    QGridLayout,
     QGroupBox,
     QHBoxLayout,
     QLabel,
@@ -44,14 +73,25 @@ from PyQt6.QtWidgets import (
     QScrollArea,
     QSizePolicy,
     QSpinBox,
+    QStyledItemDelegate,
     QTabWidget,
     QToolButton,
     QVBoxLayout,
     QWidget,
 )
 
+try:
+    import orjson  # optional: faster JSON export
+except ImportError:
+    orjson = None
+
 warnings.filterwarnings("ignore")
 
+# Diagnostics go through logging instead of print(); nothing is emitted (or
+# formatted) unless the embedding application configures a handler/level
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
 
 class DrawArrowButton(QWidget):
     """
@@ -121,11 +161,7 @@ class DrawArrowButton(QWidget):
         if event.button() == Qt.MouseButton.LeftButton and self.rect().contains(
             event.pos()
         ):
-            # emit clicked and update visuals briefly (if needed)
-            try:
-                self.clicked.emit()
-            except Exception:
-                pass
+            self.clicked.emit()
         super().mouseReleaseEvent(event)
 
     def setEnabled(self, enabled: bool):
@@ -180,18 +216,16 @@ class ModernSpinWidget(QWidget):
         self._up = DrawArrowButton("up", self)
         self._down = DrawArrowButton("down", self)
 
-        # Layout: place line edit left, buttons stacked vertically on right
-        layout = QHBoxLayout(self)
+        # Layout: line edit spans both rows on the left, buttons stacked on the right.
+        # A single grid keeps this to one layout instead of a nested pair.
+        layout = QGridLayout(self)
         # slightly tighter margins to reduce overall control width
         layout.setContentsMargins(6, 4, 6, 4)
-        layout.setSpacing(4)
-        layout.addWidget(self._line)
-        btns = QVBoxLayout()
-        btns.setContentsMargins(0, 0, 0, 0)
-        btns.setSpacing(2)
-        btns.addWidget(self._up)
-        btns.addWidget(self._down)
-        layout.addLayout(btns)
+        layout.setHorizontalSpacing(4)
+        layout.setVerticalSpacing(2)
+        layout.addWidget(self._line, 0, 0, 2, 1)
+        layout.addWidget(self._up, 0, 1)
+        layout.addWidget(self._down, 1, 1)
 
         # Make the whole widget compact and fixed width so it doesn't stretch too much
         try:
@@ -230,20 +264,10 @@ class ModernSpinWidget(QWidget):
     def _clamp(self, v):
         if v is None:
             return self._min
+        v = float(v)
         if self._is_double:
-            v = float(v)
-            if v < self._min:
-                return float(self._min)
-            if v > self._max:
-                return float(self._max)
-            return v
-        else:
-            v = int(round(float(v)))
-            if v < self._min:
-                return int(self._min)
-            if v > self._max:
-                return int(self._max)
-            return v
+            return max(float(self._min), min(v, float(self._max)))
+        return max(int(self._min), min(int(round(v)), int(self._max)))
 
     def _step_value(self, direction):
         try:
@@ -269,7 +293,7 @@ class ModernSpinWidget(QWidget):
             fmt = f"{{:.{self._decimals}f}}"
             self._line.setText(fmt.format(v))
         else:
-            self._line.setText(str(int(round(float(v)))))
+            self._line.setText(str(v))
 
     def setRange(self, minimum, maximum):
         self._min = minimum
@@ -296,7 +320,7 @@ class ModernSpinWidget(QWidget):
 
 # New: PopupList and SimpleCombo - fully custom combobox-like widget so we avoid
 # platform popup chrome, blue focus box and other native artifacts.
-from PyQt6.QtCore import QModelIndex, QPoint, QRect, pyqtSignal
+from PyQt6.QtCore import QEvent, QModelIndex, QPoint, QRect, pyqtSignal
 from PyQt6.QtGui import QFontMetrics
 from PyQt6.QtWidgets import QFrame, QPushButton
 
@@ -311,6 +335,11 @@ class PopupList(QFrame):
 
     activated = pyqtSignal(int)
 
+    # Paint resources are shared by every instance instead of rebuilt per repaint
+    _HOVER_BRUSH = QBrush(QColor("#1565C0"))
+    _HOVER_TEXT_COLOR = QColor("#FFFFFF")
+    _TEXT_COLOR = QColor("#333333")
+
     def __init__(self, parent=None):
         super().__init__(
             parent, Qt.WindowType.Popup | Qt.WindowType.FramelessWindowHint
@@ -330,19 +359,40 @@ class PopupList(QFrame):
         self.setMouseTracking(True)
         self.setMinimumWidth(120)
         self._max_visible_items = 8
+        self._fm = None  # built lazily by _font_metrics(), reset on font change
+        # set by addItems() once the width is measured, cleared on font change
+        self._measured = False
+        self._text_baseline = 0
+
+    def _font_metrics(self):
+        if self._fm is None:
+            self._fm = QFontMetrics(self.font())
+            # offset from an item's top edge to its vertically centered baseline
+            self._text_baseline = (
+                self._item_height + self._fm.ascent() - self._fm.descent()
+            ) // 2
+        return self._fm
+
+    def changeEvent(self, ev):
+        if ev.type() == QEvent.Type.FontChange:
+            self._fm = None
+            self._measured = False
+        super().changeEvent(ev)
 
     def addItems(self, items):
         # Replace items and reset state
-        self._items = list(items)
+        items = list(items)
         self._hover_index = -1
         self._vscroll = 0
+        # SimpleCombo re-adds its items on every open; skip re-measuring when
+        # neither the items nor the font changed since the last call
+        if items == self._items and self._measured:
+            return
+        self._items = items
+        self._measured = True
         # compute a reasonable width based on longest item
-        fm = QFontMetrics(self.font())
-        max_w = 0
-        for it in self._items:
-            w = fm.horizontalAdvance(it)
-            if w > max_w:
-                max_w = w
+        fm = self._font_metrics()
+        max_w = max(map(fm.horizontalAdvance, self._items), default=0)
         content_w = max_w + self._padding_h * 2
         # width should be at least current width; allow caller to resize parent if needed
         self.setMinimumWidth(content_w + 8)
@@ -365,16 +415,17 @@ class PopupList(QFrame):
             rect.height() - self._padding_v * 2,
         )
 
-        # Determine visible item range based on _vscroll
-        start_pixel = self._vscroll
-        first_index = max(0, start_pixel // self._item_height)
-        y_offset = -(start_pixel % self._item_height)
+        # Determine the item range that intersects the exposed area, based on _vscroll
+        clip = ev.rect()
+        items_top = content_rect.top() - self._vscroll  # y of item 0
+        first_index = max(0, (clip.top() - items_top) // self._item_height)
+        last_index = min(
+            len(self._items), (clip.bottom() - items_top) // self._item_height + 1
+        )
 
-        fm = QFontMetrics(self.font())
-        for i in range(first_index, len(self._items)):
-            y = content_rect.top() + y_offset + (i - first_index) * self._item_height
-            if y > rect.bottom():
-                break
+        self._font_metrics()
+        for i in range(first_index, last_index):
+            y = items_top + i * self._item_height
 
             item_rect = QRect(
                 content_rect.left() + self._padding_h,
@@ -384,7 +435,7 @@ class PopupList(QFrame):
             )
             # Draw hover/selection background
             if i == self._hover_index:
-                painter.setBrush(QBrush(QColor("#1565C0")))
+                painter.setBrush(self._HOVER_BRUSH)
                 painter.setPen(Qt.PenStyle.NoPen)
                 painter.drawRoundedRect(
                     QRect(
@@ -396,12 +447,12 @@ class PopupList(QFrame):
                     6,
                     6,
                 )
-                painter.setPen(QColor("#FFFFFF"))
+                painter.setPen(self._HOVER_TEXT_COLOR)
             else:
-                painter.setPen(QColor("#333333"))
+                painter.setPen(self._TEXT_COLOR)
 
             # Draw text vertically centered
-            text_y = y + (self._item_height + fm.ascent() - fm.descent()) // 2
+            text_y = y + self._text_baseline
             painter.drawText(item_rect.left(), text_y, self._items[i])
 
         painter.end()
@@ -432,10 +483,7 @@ class PopupList(QFrame):
     def mousePressEvent(self, ev):
         idx = self._index_at_pos(ev.position().toPoint())
         if idx != -1:
-            try:
-                self.activated.emit(int(idx))
-            except Exception:
-                pass
+            self.activated.emit(int(idx))
             self.hide()
         super().mousePressEvent(ev)
 
@@ -606,7 +654,7 @@ class SimpleCombo(QWidget):
         self.setCurrentIndex(idx)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerResult:
     name: str
     ip: str
@@ -620,51 +668,227 @@ class ServerResult:
     successful: int = 0
 
 
-DNS_SERVERS = {
-    "Google": "8.8.8.8",
-    "Google Secondary": "8.8.4.4",
-    "Cloudflare": "1.1.1.1",
-    "Cloudflare Secondary": "1.0.0.1",
-    "Cloudflare Malware": "1.1.1.2",
-    "Cloudflare Family": "1.1.1.3",
-    "Quad9": "9.9.9.9",
-    "Quad9 Secondary": "149.112.112.112",
-    "Quad9 Unsecured": "9.9.9.10",
-    "OpenDNS": "208.67.222.222",
-    "OpenDNS Secondary": "208.67.220.220",
-    "OpenDNS Family": "208.67.222.123",
-    "NextDNS": "45.90.28.0",
-    "NextDNS Secondary": "45.90.30.0",
-    "AdGuard": "94.140.14.14",
-    "AdGuard Secondary": "94.140.15.15",
-    "AdGuard Family": "94.140.14.15",
-    "CleanBrowsing": "185.228.168.9",
-    "CleanBrowsing Adult": "185.228.168.10",
-    "CleanBrowsing Family": "185.228.168.168",
-    "Level3": "4.2.2.1",
-    "Level3 Alt 1": "4.2.2.2",
-    "Level3 Alt 2": "4.2.2.3",
-    "Level3 Alt 3": "4.2.2.4",
-    "Verisign": "64.6.64.6",
-    "Verisign Secondary": "64.6.65.6",
-    "DNS.WATCH": "84.200.69.80",
-    "DNS.WATCH Secondary": "84.200.70.40",
-    "Comodo Secure": "8.26.56.26",
-    "Comodo Secondary": "8.20.247.20",
-    "Yandex": "77.88.8.8",
-    "Yandex Secondary": "77.88.8.1",
-    "Hurricane Electric": "74.82.42.42",
-    "Neustar": "156.154.70.1",
-    "Neustar Secondary": "156.154.71.1",
-    "Alternate DNS": "76.76.19.19",
-    "Alternate Secondary": "76.223.122.150",
-    "Control D": "76.76.2.0",
-    "Control D Secondary": "76.76.10.0",
-    "Mullvad": "194.242.2.2",
-    "Mullvad Secondary": "193.19.108.2",
-    "Oracle Dyn": "216.146.35.35",
-    "Dyn Secondary": "216.146.36.36",
-}
+@dataclass(slots=True)
+class ResultColumns:
+    """The ServerResult fields of a result list, one list/array per field.
+
+    Sorting, the summary, the chart layout and the exports each scan whole
+    fields, so a column is read straight from a list or packed array (or
+    zipped with the others) instead of through an attribute lookup on every
+    result. The timing and reliability columns stay lists of the original
+    values: a failed server's int 0 must reach the JSON export as 0, not the
+    0.0 an array("d") would turn it into.
+    """
+
+    names: list
+    ips: list
+    cached: list
+    uncached: list
+    overall: list
+    reliability: list
+    total_queries: array
+    successful: array
+
+    @classmethod
+    def from_results(cls, results):
+        return cls(
+            [r.name for r in results],
+            [r.ip for r in results],
+            [r.cached_avg for r in results],
+            [r.uncached_avg for r in results],
+            [r.overall_avg for r in results],
+            [r.reliability for r in results],
+            array("q", [r.total_queries for r in results]),
+            array("q", [r.successful for r in results]),
+        )
+
+
+# One exported result in json.dumps(indent=2)'s layout; %s takes an already
+# escaped JSON string, %r a float (float repr is what json writes for numbers)
+_JSON_ROW = (
+    "  {\n"
+    '    "server": %s,\n'
+    '    "ip": %s,\n'
+    '    "cached_ms": %r,\n'
+    '    "uncached_ms": %r,\n'
+    '    "average_ms": %r,\n'
+    '    "reliability_percent": %r\n'
+    "  }"
+)
+
+
+def _rounded(col, ndigits):
+    # round() over a whole column, driven by map() instead of a Python loop
+    return map(round, col, repeat(ndigits))
+
+
+def _dump_results_json(cols):
+    """Serialize ResultColumns to the exported JSON document, as UTF-8 bytes."""
+    numbers = (
+        _rounded(cols.cached, 2),
+        _rounded(cols.uncached, 2),
+        _rounded(cols.overall, 2),
+        _rounded(cols.reliability, 1),
+    )
+    if orjson is not None:
+        return orjson.dumps(
+            [
+                {
+                    "server": name,
+                    "ip": ip,
+                    "cached_ms": cached,
+                    "uncached_ms": uncached,
+                    "average_ms": overall,
+                    "reliability_percent": reliability,
+                }
+                for name, ip, cached, uncached, overall, reliability in zip(
+                    cols.names, cols.ips, *numbers
+                )
+            ],
+            option=orjson.OPT_INDENT_2,
+        )
+    if not cols.names:
+        return b"[]"
+    # without orjson, formatting each row straight into the document is about
+    # twice as fast as building a dict per row for json.dumps to walk again
+    rows = zip(map(_json_str, cols.names), map(_json_str, cols.ips), *numbers)
+    body = ",\n".join([_JSON_ROW % row for row in rows])
+    return f"[\n{body}\n]".encode()
+
+
+def _dump_results_csv(cols):
+    """Serialize ResultColumns to the exported CSV document, as UTF-8 bytes."""
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    writer.writerow(
+        ["Server", "IP", "Cached_ms", "Uncached_ms", "Avg_ms", "Reliability_%"]
+    )
+    # writerows drives the loop from C, and zip/map walk the columns without a
+    # Python-level step per row; the numbers are preformatted to the JSON
+    # export's precision
+    ms = "{:.2f}".format
+    writer.writerows(
+        zip(
+            cols.names,
+            cols.ips,
+            map(ms, cols.cached),
+            map(ms, cols.uncached),
+            map(ms, cols.overall),
+            map("{:.1f}".format, cols.reliability),
+        )
+    )
+    return buf.getvalue().encode()
+
+
+# O_BINARY only exists (and matters) on Windows, where the default text mode
+# would turn every b"\n" into b"\r\n"
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+# large exports are written in slices of this size so progress can be reported
+EXPORT_CHUNK = 1 << 20
+
+
+def _write_bytes(filename, data, progress=None):
+    # the blob is already complete, so hand it to the OS directly instead of
+    # copying it through a buffered file object; progress(pct) follows each write
+    fd = os.open(filename, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        total = len(view)
+        done = 0
+        while done < total:
+            done += os.write(fd, view[done : done + EXPORT_CHUNK])
+            if progress is not None:
+                progress(done * 100 // total)
+    finally:
+        os.close(fd)
+
+
+# (name, ip) pairs; never mutated, so a tuple keeps it frozen and cheap to iterate
+DNS_SERVERS = (
+    ("Google", "8.8.8.8"),
+    ("Google Secondary", "8.8.4.4"),
+    ("Cloudflare", "1.1.1.1"),
+    ("Cloudflare Secondary", "1.0.0.1"),
+    ("Cloudflare Malware", "1.1.1.2"),
+    ("Cloudflare Family", "1.1.1.3"),
+    ("Quad9", "9.9.9.9"),
+    ("Quad9 Secondary", "149.112.112.112"),
+    ("Quad9 Unsecured", "9.9.9.10"),
+    ("OpenDNS", "208.67.222.222"),
+    ("OpenDNS Secondary", "208.67.220.220"),
+    ("OpenDNS Family", "208.67.222.123"),
+    ("NextDNS", "45.90.28.0"),
+    ("NextDNS Secondary", "45.90.30.0"),
+    ("AdGuard", "94.140.14.14"),
+    ("AdGuard Secondary", "94.140.15.15"),
+    ("AdGuard Family", "94.140.14.15"),
+    ("CleanBrowsing", "185.228.168.9"),
+    ("CleanBrowsing Adult", "185.228.168.10"),
+    ("CleanBrowsing Family", "185.228.168.168"),
+    ("Level3", "4.2.2.1"),
+    ("Level3 Alt 1", "4.2.2.2"),
+    ("Level3 Alt 2", "4.2.2.3"),
+    ("Level3 Alt 3", "4.2.2.4"),
+    ("Verisign", "64.6.64.6"),
+    ("Verisign Secondary", "64.6.65.6"),
+    ("DNS.WATCH", "84.200.69.80"),
+    ("DNS.WATCH Secondary", "84.200.70.40"),
+    ("Comodo Secure", "8.26.56.26"),
+    ("Comodo Secondary", "8.20.247.20"),
+    ("Yandex", "77.88.8.8"),
+    ("Yandex Secondary", "77.88.8.1"),
+    ("Hurricane Electric", "74.82.42.42"),
+    ("Neustar", "156.154.70.1"),
+    ("Neustar Secondary", "156.154.71.1"),
+    ("Alternate DNS", "76.76.19.19"),
+    ("Alternate Secondary", "76.223.122.150"),
+    ("Control D", "76.76.2.0"),
+    ("Control D Secondary", "76.76.10.0"),
+    ("Mullvad", "194.242.2.2"),
+    ("Mullvad Secondary", "193.19.108.2"),
+    ("Oracle Dyn", "216.146.35.35"),
+    ("Dyn Secondary", "216.146.36.36"),
+)
+DNS_SERVERS_DICT = dict(DNS_SERVERS)
+# Display order for the server checkboxes
+_DNS_ITEMS = tuple(sorted(DNS_SERVERS))
+
+
+# Minimum seconds between progress signals from the worker threads
+PROGRESS_INTERVAL = 0.05
+# Milliseconds the GUI coalesces progress updates for (about one frame)
+PROGRESS_FLUSH_MS = 16
+# Servers benchmarked at the same time. Every reply waits for the event loop
+# before its timer stops, so more in flight means inflated latencies.
+BENCH_CONCURRENCY = 4
+
+
+# Maps every byte value onto a-z so random bytes become a label via bytes.translate
+_LABEL_TABLE = bytes(ord("a") + i % 26 for i in range(256))
+
+
+def _random_domains(count, length=8):
+    """Return `count` random .com names built from one batch of random bytes."""
+    letters = os.urandom(count * length).translate(_LABEL_TABLE).decode("ascii")
+    return [f"{letters[i : i + length]}.com" for i in range(0, len(letters), length)]
+
+
+def _aggregate(times):
+    """Return (mean, min, max, count) of `times` in one pass; all zeros if empty."""
+    n = len(times)
+    if not n:
+        return 0, 0, 0, 0
+    total = 0.0
+    lo = hi = times[0]
+    for t in times:
+        total += t
+        if t < lo:
+            lo = t
+        elif t > hi:
+            hi = t
+    return total / n, lo, hi, n
 
 
 class BenchThread(QThread):
@@ -674,79 +898,113 @@ class BenchThread(QThread):
 
     def __init__(self, servers, query_count):
         super().__init__()
-        self.servers = servers
+        # sequence of (name, ip) pairs, as in DNS_SERVERS
+        self.servers = list(servers)
+        self._total = len(self.servers)
         self.query_count = query_count
         self._is_running = True
 
     def run(self):
-        results = []
-        total = len(self.servers)
-
         try:
-            for idx, (name, ip) in enumerate(self.servers.items()):
-                if not self._is_running:
-                    break
-
-                try:
-                    progress_val = int((idx / total) * 100)
-                    self.progress.emit(progress_val, f"Testing {name}...")
-                except:
-                    pass
-
-                try:
-                    result = self.test_single_server(name, ip)
-                    results.append(result)
-                except Exception as e:
-                    print(f"Error testing {name}: {e}")
-                    results.append(ServerResult(name=name, ip=ip))
-
+            results = asyncio.run(self._bench_all())
             if self._is_running:
-                try:
-                    self.progress.emit(100, "Complete!")
-                    self.finished_signal.emit(results)
-                except Exception as e:
-                    self.error_signal.emit(str(e))
+                self.progress.emit(100, "Complete!")
+                self.finished_signal.emit(results)
 
         except Exception as e:
             self.error_signal.emit(str(e))
 
-    def test_single_server(self, name, ip):
-        cached_times = []
-        uncached_times = []
-
+    async def _bench_all(self):
+        # A few servers are tested at a time; the benchmark is almost entirely
+        # time spent waiting on the network, so overlapping them cuts wall
+        # time while BENCH_CONCURRENCY keeps loop contention out of the timings.
+        total = self._total
+        limit = asyncio.Semaphore(BENCH_CONCURRENCY)
+
+        async def test(name, ip):
+            async with limit:
+                return await self._test_async(name, ip)
+
+        tasks = [asyncio.ensure_future(test(name, ip)) for name, ip in self.servers]
+
+        last_emit = 0.0
+        for done, task in enumerate(asyncio.as_completed(tasks), 1):
+            result = await task
+            # servers tend to finish in bursts; cap GUI updates at ~20 per second
+            now = time.monotonic()
+            if done < total and now - last_emit < PROGRESS_INTERVAL:
+                continue
+            last_emit = now
+            progress_val = int((done / total) * 100)
+            self.progress.emit(progress_val, f"Tested {result.name}...")
+
+        # keep results in server order rather than completion order
+        return [task.result() for task in tasks]
+
+    async def _run_queries(self, queries, ip):
+        """
+        Send `queries` to `ip` one after another over a single connected UDP
+        socket and return the elapsed milliseconds of each (0 for failures).
+        Only the sendto/recvfrom pair is timed; encoding and parsing happen
+        outside the window.
+        """
+        backend = dns.asyncbackend.get_default_backend()
+        af = dns.inet.af_for_address(ip)
+        sock = None
+        times = []
         try:
-            for i in range(self.query_count):
-                if not self._is_running:
-                    break
-                try:
-                    query = dns.message.make_query("google.com", "A")
-                    start = time.perf_counter()
-                    dns.query.udp(query, ip, timeout=2.0)
-                    elapsed = (time.perf_counter() - start) * 1000
-                    if elapsed > 0:
-                        cached_times.append(elapsed)
-                except:
-                    pass
-
-            for i in range(self.query_count):
+            for query in queries:
                 if not self._is_running:
                     break
-                try:
-                    domain = (
-                        f"{''.join(random.choices(string.ascii_lowercase, k=8))}.com"
+                if sock is None:
+                    sock = await backend.make_socket(
+                        af, socket.SOCK_DGRAM, 0, None, (ip, 53)
                     )
-                    query = dns.message.make_query(domain, "A")
+                wire = query.to_wire()
+                try:
                     start = time.perf_counter()
-                    dns.query.udp(query, ip, timeout=2.0)
-                    elapsed = (time.perf_counter() - start) * 1000
-                    if elapsed > 0:
-                        uncached_times.append(elapsed)
+                    # the socket is connected, so no destination is needed
+                    await sock.sendto(wire, None, 2.0)
+                    reply, _ = await sock.recvfrom(65535, 2.0)
+                    elapsed = time.perf_counter() - start
+                    if not query.is_response(dns.message.from_wire(reply)):
+                        raise dns.query.BadResponse
+                    times.append(elapsed * 1000)
                 except:
-                    pass
+                    times.append(0)
+                    # a late reply to the failed query would be read by the next
+                    # one, so start over with a fresh socket
+                    await sock.close()
+                    sock = None
+        finally:
+            if sock is not None:
+                await sock.close()
+        return times
+
+    async def _test_async(self, name, ip):
+        try:
+            # Build every query up front so message construction never lands
+            # inside the timed window in _run_queries.
+            query = dns.message.make_query("google.com", "A")
+            uncached_queries = [
+                dns.message.make_query(domain, "A")
+                for domain in _random_domains(self.query_count)
+            ]
+
+            # Queries to one server share a socket, so they run sequentially;
+            # concurrent receivers on the same socket would steal each other's
+            # replies. Servers are still tested concurrently.
+            times = await self._run_queries(
+                [query] * self.query_count + uncached_queries, ip
+            )
+            cached_times = [t for t in times[: self.query_count] if t > 0]
+            uncached_times = [t for t in times[self.query_count :] if t > 0]
 
-            all_times = cached_times + uncached_times
-            cached_avg = statistics.mean(cached_times) if cached_times else 0
-            uncached_avg = statistics.mean(uncached_times) if uncached_times else 0
+            cached_avg, cached_min, cached_max, cached_n = _aggregate(cached_times)
+            uncached_avg, uncached_min, uncached_max, uncached_n = _aggregate(
+                uncached_times
+            )
+            successful = cached_n + uncached_n
             overall_avg = (
                 (cached_avg + uncached_avg) / 2
                 if cached_avg and uncached_avg
@@ -759,16 +1017,18 @@ class BenchThread(QThread):
                 cached_avg=cached_avg,
                 uncached_avg=uncached_avg,
                 overall_avg=overall_avg,
-                min_time=min(all_times) if all_times else 0,
-                max_time=max(all_times) if all_times else 0,
-                reliability=(len(all_times) / (self.query_count * 2) * 100)
+                min_time=min(cached_min, uncached_min)
+                if cached_n and uncached_n
+                else max(cached_min, uncached_min),
+                max_time=max(cached_max, uncached_max),
+                reliability=(successful / (self.query_count * 2) * 100)
                 if self.query_count
                 else 0,
                 total_queries=self.query_count * 2,
-                successful=len(all_times),
+                successful=successful,
             )
         except Exception as e:
-            print(f"Server test error: {e}")
+            log.debug("Error testing %s: %s", name, e)
             return ServerResult(name=name, ip=ip)
 
     def stop(self):
@@ -777,88 +1037,286 @@ class BenchThread(QThread):
 
 class SecurityThread(QThread):
     progress = pyqtSignal(int)
-    result = pyqtSignal(str, str)
+    # list of (name, status) pairs completed since the previous emit
+    results = pyqtSignal(list)
     finished_signal = pyqtSignal()
 
     def __init__(self, servers):
         super().__init__()
-        self.servers = servers
+        # sequence of (name, ip) pairs, as in DNS_SERVERS
+        self.servers = list(servers)
+        self._total = len(self.servers)
         self._is_running = True
 
     def run(self):
         try:
-            for i, (name, ip) in enumerate(self.servers.items()):
-                if not self._is_running:
-                    break
-
-                status = "error"
-                try:
-                    query = dns.message.make_query(
-                        "cloudflare.com", dns.rdatatype.DNSKEY
-                    )
-                    query.want_dnssec(True)
-                    response = dns.query.udp(query, ip, timeout=2.0)
-                    has_dnskey = any(
-                        rrset.rdtype == dns.rdatatype.DNSKEY
-                        for rrset in response.answer
-                    )
-                    has_rrsig = any(
-                        rrset.rdtype == dns.rdatatype.RRSIG for rrset in response.answer
-                    )
-                    status = (
-                        "valid" if has_rrsig else "signed" if has_dnskey else "unsigned"
-                    )
-                except:
-                    status = "error"
-
-                try:
-                    self.result.emit(name, status)
-                    self.progress.emit(int((i + 1) / len(self.servers) * 100))
-                except:
-                    pass
-
+            asyncio.run(self._scan())
             self.finished_signal.emit()
         except:
             self.finished_signal.emit()
 
+    async def _check(self, query, name, ip):
+        status = "error"
+        try:
+            # udp() has its own 2s timeout; wait_for only guards against hangs
+            response = await asyncio.wait_for(
+                dns.asyncquery.udp(query, ip, timeout=2.0), 2.5
+            )
+            has_dnskey = any(
+                rrset.rdtype == dns.rdatatype.DNSKEY for rrset in response.answer
+            )
+            has_rrsig = any(
+                rrset.rdtype == dns.rdatatype.RRSIG for rrset in response.answer
+            )
+            status = "valid" if has_rrsig else "signed" if has_dnskey else "unsigned"
+        except:
+            status = "error"
+        return name, status
+
+    async def _scan(self):
+        # Probe every server at once so the scan takes about one timeout in
+        # total instead of one per unreachable server.
+        query = dns.message.make_query("cloudflare.com", dns.rdatatype.DNSKEY)
+        query.want_dnssec(True)
+        total = self._total
+        checks = [self._check(query, name, ip) for name, ip in self.servers]
+
+        last_emit = 0.0
+        pending = []
+        for done, check in enumerate(asyncio.as_completed(checks), 1):
+            pending.append(await check)
+            if not self._is_running:
+                break
+
+            # results are delivered in batches at the same capped rate as
+            # progress, so a burst of answers costs the GUI one layout pass
+            now = time.monotonic()
+            if done == total or now - last_emit >= PROGRESS_INTERVAL:
+                last_emit = now
+                self.results.emit(pending)
+                pending = []
+                self.progress.emit(int(done / total * 100))
+
     def stop(self):
         self._is_running = False
 
 
+class ExportThread(QThread):
+    """Serializes ResultColumns with one of the dump helpers and writes the
+    bytes off the GUI thread. If ``data`` is given it is written as-is."""
+
+    progress = pyqtSignal(int)
+    finished_signal = pyqtSignal(str)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self, dump, filename, columns, data=None):
+        super().__init__()
+        self.dump = dump
+        self.filename = filename
+        # never mutated once built, so a new benchmark can't change what is
+        # being written
+        self.columns = columns
+        self.data = data
+
+    def run(self):
+        try:
+            if self.data is None:
+                self.data = self.dump(self.columns)
+            _write_bytes(self.filename, self.data, self.progress.emit)
+            self.finished_signal.emit(self.filename)
+        except Exception as e:
+            self.error_signal.emit(str(e))
+
+
 class ResultsChart(QWidget):
+    # Paint resources are shared by every instance instead of rebuilt per repaint.
+    # Fonts are created in __init__: a QFont built before QApplication exists
+    # resolves its point size against the wrong DPI.
+
+    # Matches the white results scroll area the chart sits in
+    _BACKGROUND_COLOR = QColor("#FFFFFF")
+
+    _PLACEHOLDER_COLOR = QColor("#333333")
+    _GRID_PEN = QPen(QColor("#E8E8E8"), 1)
+    _LABEL_COLOR = QColor("#999999")
+    _NAME_COLOR = QColor("#212121")
+    _IP_COLOR = QColor("#888888")
+    _CACHED_BRUSH = QBrush(QColor("#4CAF50"))
+    _UNCACHED_BRUSH = QBrush(QColor("#F44336"))
+    _AVG_COLOR = QColor("#1565C0")
+    _AVG_PEN = QPen(_AVG_COLOR, 3)
+    # Reliability dot brushes, indexed by bisect_left(_RELIABILITY_CUTS, pct):
+    # <= 80% poor, <= 95% fair, above that good
+    _RELIABILITY_CUTS = (80, 95)
+    _RELIABILITY_BRUSHES = (
+        QBrush(QColor("#F44336")),
+        QBrush(QColor("#FF9800")),
+        QBrush(QColor("#4CAF50")),
+    )
+    _AXIS_TITLE_COLOR = QColor("#666666")
+    _LEGEND_COLOR = QColor("#333333")
+
+    # Chart layout, in pixels
+    _LEFT_MARGIN = 180
+    _RIGHT_MARGIN = 30
+    _TOP_MARGIN = 40
+    _BAR_HEIGHT = 16
+    _SPACING = 58
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.results = []
+        self._columns = ResultColumns.from_results([])
         self.max_val = 100
+        self._placeholder_font = QFont("Segoe UI", 14)
+        self._label_font = QFont("Segoe UI", 9)
+        self._name_font = QFont("Segoe UI", 11, QFont.Weight.Bold)
+        self._avg_font = QFont("Segoe UI", 9, QFont.Weight.Bold)
+        self._legend_font = QFont("Segoe UI", 10)
+        # Rendered chart; rebuilt only after set_results() or a resize
+        self._cache = None
+        # Pre-laid-out text, rebuilt in set_results()
+        self._name_texts = []
+        self._ip_texts = []
+        self._axis_texts = []
+        self._avg_texts = []
+        # (x, label) per axis tick; rebuilt in set_results() and on resize
+        self._axis_cache = []
+        # (cached, uncached, overall) bar width per row; rebuilt likewise
+        self._bar_widths = []
+        # Index into _RELIABILITY_BRUSHES per row, rebuilt in set_results()
+        self._reliability_buckets = []
         self.setMinimumHeight(500)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        # The cached pixmap is opaque and covers the whole widget, so Qt
+        # needn't clear the background before every paint
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
 
     def set_results(self, results):
         self.results = results
-        if results:
-            all_vals = []
-            for r in results:
-                if r.cached_avg > 0:
-                    all_vals.append(r.cached_avg)
-                if r.uncached_avg > 0:
-                    all_vals.append(r.uncached_avg)
-                if r.overall_avg > 0:
-                    all_vals.append(r.overall_avg)
-            if all_vals:
-                self.max_val = max(max(all_vals) * 1.2, 50)
+        cols = self._columns = ResultColumns.from_results(results)
+        peak = max(
+            (v for col in (cols.cached, cols.uncached, cols.overall) for v in col),
+            default=0,
+        )
+        if peak:
+            self.max_val = max(peak * 1.2, 50)
+
+        self._name_texts = [
+            self._static_text(r.name, self._name_font) for r in results
+        ]
+        self._ip_texts = [self._static_text(r.ip, self._label_font) for r in results]
+        # average labels; rows without an average never draw theirs
+        self._avg_texts = [
+            self._static_text(f"{r.overall_avg:.1f}", self._avg_font)
+            if r.overall_avg > 0
+            else None
+            for r in results
+        ]
+        self._axis_texts = [
+            self._static_text(f"{self.max_val * j / 6:.0f}", self._label_font)
+            for j in range(7)
+        ]
+        self._rebuild_axis_cache()
+        self._rebuild_bar_widths()
+        cuts = self._RELIABILITY_CUTS
+        self._reliability_buckets = [bisect_left(cuts, v) for v in cols.reliability]
 
         height = max(600, len(results) * 65 + 100)
         self.setMinimumHeight(height)
+        self._cache = None
         self.update()
 
+    @staticmethod
+    def _static_text(text, font):
+        st = QStaticText(text)
+        st.setTextFormat(Qt.TextFormat.PlainText)
+        st.prepare(QTransform(), font)
+        return st
+
+    @staticmethod
+    def _draw_static_text(painter, st, x, y, w, h, align):
+        """Draw a prepared QStaticText the way drawText(x, y, w, h, align) would."""
+        size = st.size()
+        # drawText clips to its rect; only pay for a clip when the text overflows
+        overflow = size.width() > w or size.height() > h
+        if overflow:
+            painter.save()
+            painter.setClipRect(x, y, w, h)
+        tx, ty = x, y
+        if align & Qt.AlignmentFlag.AlignRight:
+            tx += w - size.width()
+        elif align & Qt.AlignmentFlag.AlignHCenter:
+            tx += (w - size.width()) / 2
+        if align & Qt.AlignmentFlag.AlignVCenter:
+            ty += (h - size.height()) / 2
+        painter.drawStaticText(QPointF(tx, ty), st)
+        if overflow:
+            painter.restore()
+
+    def _rebuild_axis_cache(self):
+        chart_width = self.width() - self._LEFT_MARGIN - self._RIGHT_MARGIN
+        self._axis_cache = [
+            (int(self._LEFT_MARGIN + chart_width * j / 6), st)
+            for j, st in enumerate(self._axis_texts)
+        ]
+
+    def _rebuild_bar_widths(self):
+        chart_width = self.width() - self._LEFT_MARGIN - self._RIGHT_MARGIN
+        max_val = self.max_val
+        cols = self._columns
+        self._bar_widths = [
+            (
+                int(min(cached / max_val * chart_width, chart_width)),
+                int(min(uncached / max_val * chart_width, chart_width)),
+                int(min(overall / max_val * chart_width, chart_width)),
+            )
+            for cached, uncached, overall in zip(
+                cols.cached, cols.uncached, cols.overall
+            )
+        ]
+
+    def resizeEvent(self, a0):
+        self._cache = None
+        self._rebuild_axis_cache()
+        self._rebuild_bar_widths()
+        super().resizeEvent(a0)
+
     def paintEvent(self, a0):
+        # The chart usually sits in a scroll area; only the exposed part needs work
+        clip = a0.rect()
+        if not self.isVisible() or clip.isEmpty():
+            return
+
+        dpr = self.devicePixelRatioF()
+        if (
+            self._cache is None
+            or self._cache.devicePixelRatio() != dpr
+            or self._cache.size() != self.size() * dpr
+        ):
+            self._render_to_cache(dpr)
+
+        # Qt clips this blit to the exposed region
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache)
+
+    def _render_to_cache(self, dpr):
+        """Render the whole chart into a fresh pixmap at the given pixel ratio."""
+        self._cache = QPixmap(self.size() * dpr)
+        self._cache.setDevicePixelRatio(dpr)
+        self._cache.fill(self._BACKGROUND_COLOR)
+        painter = QPainter(self._cache)
+        self._draw_chart(painter)
+        painter.end()
+
+    def _draw_chart(self, painter):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         if not self.results:
-            painter.setPen(QColor("#333333"))
-            font = QFont("Segoe UI", 14)
-            painter.setFont(font)
+            painter.setPen(self._PLACEHOLDER_COLOR)
+            painter.setFont(self._placeholder_font)
             painter.drawText(
                 self.rect(),
                 Qt.AlignmentFlag.AlignCenter,
@@ -866,116 +1324,121 @@ class ResultsChart(QWidget):
             )
             return
 
-        left_margin = 180
-        right_margin = 30
-        top_margin = 40
-        bar_height = 16
-        spacing = 58
-
-        chart_width = self.width() - left_margin - right_margin
-
-        painter.setPen(QPen(QColor("#E8E8E8"), 1))
-        for j in range(7):
-            x = left_margin + (chart_width * j / 6)
-            painter.drawLine(
-                int(x),
-                top_margin - 10,
-                int(x),
-                top_margin + len(self.results) * spacing,
-            )
-            painter.setPen(QColor("#999999"))
-            font = QFont("Segoe UI", 9)
-            painter.setFont(font)
-            val = self.max_val * j / 6
-            painter.drawText(
-                int(x) - 25,
+        left_margin = self._LEFT_MARGIN
+        right_margin = self._RIGHT_MARGIN
+        top_margin = self._TOP_MARGIN
+        bar_height = self._BAR_HEIGHT
+        spacing = self._SPACING
+        # The width can't change mid-paint; derive the per-row x limits once
+        width = self.width()
+        text_x_limit = width - right_margin - 35
+        dot_x = width - 18
+
+        grid_bottom = top_margin + len(self.results) * spacing
+        painter.setPen(self._GRID_PEN)
+        for x, _ in self._axis_cache:
+            painter.drawLine(x, top_margin - 10, x, grid_bottom)
+
+        painter.setPen(self._LABEL_COLOR)
+        painter.setFont(self._label_font)
+        for x, st in self._axis_cache:
+            self._draw_static_text(
+                painter,
+                st,
+                x - 25,
                 top_margin - 15,
                 50,
                 20,
                 Qt.AlignmentFlag.AlignCenter,
-                f"{val:.0f}",
             )
-            painter.setPen(QPen(QColor("#E8E8E8"), 1))
 
+        cached_bars = []
+        uncached_bars = []
+        avg_lines = []
+        avg_labels = []
+        dots = tuple(QPainterPath() for _ in self._RELIABILITY_BRUSHES)
+
+        # The cache always holds the whole chart, so every row is drawn;
+        # scrolling and partial exposes are served by blitting the cache
         for i, result in enumerate(self.results):
             y = top_margin + i * spacing
 
-            painter.setPen(QColor("#212121"))
-            font = QFont("Segoe UI", 11, QFont.Weight.Bold)
-            painter.setFont(font)
-            painter.drawText(
+            painter.setPen(self._NAME_COLOR)
+            painter.setFont(self._name_font)
+            self._draw_static_text(
+                painter,
+                self._name_texts[i],
                 10,
                 y,
                 left_margin - 15,
                 22,
                 Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                result.name,
             )
 
-            font = QFont("Segoe UI", 9)
-            painter.setFont(font)
-            painter.setPen(QColor("#888888"))
-            painter.drawText(
+            painter.setFont(self._label_font)
+            painter.setPen(self._IP_COLOR)
+            self._draw_static_text(
+                painter,
+                self._ip_texts[i],
                 10,
                 y + 20,
                 left_margin - 15,
                 16,
                 Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                result.ip,
             )
 
+            cached_width, uncached_width, avg_width = self._bar_widths[i]
             if result.cached_avg > 0:
-                width = min(
-                    (result.cached_avg / self.max_val) * chart_width, chart_width
-                )
-                painter.fillRect(
-                    left_margin, y + 6, int(width), bar_height, QColor("#4CAF50")
-                )
+                cached_bars.append(QRect(left_margin, y + 6, cached_width, bar_height))
 
             if result.uncached_avg > 0:
-                width = min(
-                    (result.uncached_avg / self.max_val) * chart_width, chart_width
-                )
-                painter.fillRect(
-                    left_margin, y + 36, int(width), bar_height, QColor("#F44336")
+                uncached_bars.append(
+                    QRect(left_margin, y + 36, uncached_width, bar_height)
                 )
 
             if result.overall_avg > 0:
-                avg_width = min(
-                    (result.overall_avg / self.max_val) * chart_width, chart_width
-                )
                 # Center the average line between cached bar (y+6 to y+22) and uncached bar (y+36 to y+52)
                 # Center point = (22 + 36) / 2 = 29, so y + 29
                 avg_y = y + 29
-                painter.setPen(QPen(QColor("#1565C0"), 3))
-                painter.drawLine(
-                    left_margin, avg_y, int(left_margin + avg_width), avg_y
-                )
-                painter.setPen(QColor("#1565C0"))
-                font = QFont("Segoe UI", 9, QFont.Weight.Bold)
-                painter.setFont(font)
-                avg_text = f"{result.overall_avg:.1f}"
-                text_x = int(left_margin + avg_width) + 5
-                if text_x + 35 > self.width() - right_margin:
-                    text_x = int(left_margin + avg_width) - 40
-                painter.drawText(
-                    text_x, avg_y - 8, 35, 18, Qt.AlignmentFlag.AlignLeft, avg_text
+                avg_lines.append(
+                    QLine(left_margin, avg_y, left_margin + avg_width, avg_y)
                 )
+                text_x = left_margin + avg_width + 5
+                if text_x > text_x_limit:
+                    text_x = left_margin + avg_width - 40
+                avg_labels.append((text_x, avg_y - 8, self._avg_texts[i]))
 
-            dot_x = self.width() - 18
             dot_y = y + 22
-            if result.reliability > 95:
-                painter.setBrush(QBrush(QColor("#4CAF50")))
-            elif result.reliability > 80:
-                painter.setBrush(QBrush(QColor("#FF9800")))
-            else:
-                painter.setBrush(QBrush(QColor("#F44336")))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(dot_x, dot_y, 10, 10)
+            dots[self._reliability_buckets[i]].addEllipse(dot_x, dot_y, 10, 10)
 
-        painter.setPen(QColor("#666666"))
-        font = QFont("Segoe UI", 10)
-        painter.setFont(font)
+        # Draw the collected shapes with one call per color, in the same
+        # bars -> average line -> label -> dot order as drawing them row by row
+        # The bars are pixel-aligned rects; only curves and lines need AA
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._CACHED_BRUSH)
+        painter.drawRects(cached_bars)
+        painter.setBrush(self._UNCACHED_BRUSH)
+        painter.drawRects(uncached_bars)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        painter.setPen(self._AVG_PEN)
+        painter.drawLines(avg_lines)
+
+        painter.setPen(self._AVG_COLOR)
+        painter.setFont(self._avg_font)
+        for text_x, text_y, st in avg_labels:
+            self._draw_static_text(
+                painter, st, text_x, text_y, 35, 18, Qt.AlignmentFlag.AlignLeft
+            )
+
+        for path, brush in zip(dots, self._RELIABILITY_BRUSHES):
+            painter.fillPath(path, brush)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+
+        # The axis title and legend share one font, so it is set only once
+        painter.setPen(self._AXIS_TITLE_COLOR)
+        painter.setFont(self._legend_font)
         painter.drawText(
             left_margin,
             top_margin + len(self.results) * spacing + 25,
@@ -983,15 +1446,15 @@ class ResultsChart(QWidget):
         )
 
         legend_y = top_margin + len(self.results) * spacing + 50
-        painter.fillRect(left_margin, legend_y, 20, 12, QColor("#4CAF50"))
-        painter.setPen(QColor("#333333"))
-        font = QFont("Segoe UI", 10)
-        painter.setFont(font)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        painter.fillRect(left_margin, legend_y, 20, 12, self._CACHED_BRUSH)
+        painter.fillRect(left_margin + 100, legend_y, 20, 12, self._UNCACHED_BRUSH)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        painter.setPen(self._LEGEND_COLOR)
         painter.drawText(
             left_margin + 25, legend_y - 2, 60, 16, Qt.AlignmentFlag.AlignLeft, "Cached"
         )
-
-        painter.fillRect(left_margin + 100, legend_y, 20, 12, QColor("#F44336"))
         painter.drawText(
             left_margin + 125,
             legend_y - 2,
@@ -1001,11 +1464,11 @@ class ResultsChart(QWidget):
             "Uncached",
         )
 
-        painter.setPen(QPen(QColor("#1565C0"), 3))
+        painter.setPen(self._AVG_PEN)
         painter.drawLine(
             left_margin + 210, legend_y + 5, left_margin + 230, legend_y + 5
         )
-        painter.setPen(QColor("#333333"))
+        painter.setPen(self._LEGEND_COLOR)
         painter.drawText(
             left_margin + 235,
             legend_y - 2,
@@ -1016,6 +1479,145 @@ class ResultsChart(QWidget):
         )
 
 
+class DnssecModel(QAbstractListModel):
+    """DNSSEC results for the Security tab, one (name, ip, text, state) row per
+    server in the order the results arrived."""
+
+    # status -> (label text, state used by DnssecDelegate to pick a color)
+    _STATUS = {
+        "valid": ("DNSSEC Valid", "valid"),
+        "signed": ("Signed", "signed"),
+        "unsigned": ("No DNSSEC", "unsigned"),
+    }
+    _STATUS_ERROR = ("Error", "error")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._row_of = {}  # server name -> index into _rows
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][0]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._rows[index.row()]
+        return None
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._row_of = {}
+        self.endResetModel()
+
+    def add_results(self, results):
+        """Append (name, status) results, updating servers already listed."""
+        new_rows = []
+        for name, status in results:
+            text, state = self._STATUS.get(status, self._STATUS_ERROR)
+            row = (name, DNS_SERVERS_DICT.get(name, ""), text, state)
+            i = self._row_of.get(name)
+            if i is None:
+                self._row_of[name] = len(self._rows) + len(new_rows)
+                new_rows.append(row)
+            else:
+                self._rows[i] = row
+                index = self.index(i)
+                self.dataChanged.emit(index, index)
+        if new_rows:
+            # one insert for the whole batch, so the view lays out once
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            self._rows.extend(new_rows)
+            self.endInsertRows()
+
+
+class DnssecDelegate(QStyledItemDelegate):
+    """Paints a DnssecModel row as a card; no widgets are created per row."""
+
+    _CARD_HEIGHT = 50
+    _SPACING = 8  # gap between cards
+    _MARGIN = 10  # inset of the cards from the list's edges
+    _PADDING = 22  # inset of the texts from the card's edges, border included
+    _IP_GAP = 30  # space between the IP and the status text
+    _STATUS_WIDTH = 140
+
+    _CARD_BRUSH = QBrush(QColor("#FFFFFF"))
+    _CARD_PEN = QPen(QColor("#E0E0E0"), 2)
+    _NAME_COLOR = QColor("#000000")
+    _IP_COLOR = QColor("#757575")
+    _STATE_COLORS = {
+        "valid": QColor("#2E7D32"),
+        "signed": QColor("#F57C00"),
+        "unsigned": QColor("#C62828"),
+    }
+    _ERROR_COLOR = QColor("#757575")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # fonts are built per instance: they need a QApplication to exist
+        self._name_font = QFont("Segoe UI")
+        self._name_font.setPixelSize(15)
+        self._name_font.setBold(True)
+        self._ip_font = QFont("Segoe UI")
+        self._ip_font.setPixelSize(12)
+        self._status_font = QFont("Segoe UI")
+        self._status_font.setPixelSize(14)
+        self._status_font.setBold(True)
+        self._ip_metrics = QFontMetrics(self._ip_font)
+        self._status_metrics = QFontMetrics(self._status_font)
+
+    def sizeHint(self, option, index):
+        return QSize(0, self._CARD_HEIGHT + self._SPACING)
+
+    def paint(self, painter, option, index):
+        name, ip, text, state = index.data(Qt.ItemDataRole.UserRole)
+        half = self._SPACING // 2
+        card = option.rect.adjusted(self._MARGIN, half, -self._MARGIN, -half)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self._CARD_PEN)
+        painter.setBrush(self._CARD_BRUSH)
+        # inset by half the pen so the 2px border stays inside the card
+        painter.drawRoundedRect(QRectF(card).adjusted(1, 1, -1, -1), 8, 8)
+
+        text_rect = card.adjusted(self._PADDING, 0, -self._PADDING, 0)
+        valign = Qt.AlignmentFlag.AlignVCenter
+        status_w = max(
+            self._STATUS_WIDTH, self._status_metrics.horizontalAdvance(text)
+        )
+        status_x = text_rect.right() + 1 - status_w
+        painter.setFont(self._status_font)
+        painter.setPen(self._STATE_COLORS.get(state, self._ERROR_COLOR))
+        painter.drawText(
+            QRect(status_x, card.top(), status_w, card.height()),
+            Qt.AlignmentFlag.AlignLeft | valign,
+            text,
+        )
+        right = status_x - self._IP_GAP
+        if ip:
+            ip_w = self._ip_metrics.horizontalAdvance(ip)
+            right -= ip_w
+            painter.setFont(self._ip_font)
+            painter.setPen(self._IP_COLOR)
+            painter.drawText(
+                QRect(right, card.top(), ip_w, card.height()),
+                Qt.AlignmentFlag.AlignLeft | valign,
+                ip,
+            )
+        painter.setFont(self._name_font)
+        painter.setPen(self._NAME_COLOR)
+        painter.drawText(
+            QRect(text_rect.left(), card.top(), right - text_rect.left(), card.height()),
+            Qt.AlignmentFlag.AlignLeft | valign,
+            name,
+        )
+        painter.restore()
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -1023,12 +1625,34 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1400, 900)
 
         self.results = []
+        # self.results as columns, replaced together with it; the exports
+        # zip over these instead of reading attributes off every result
+        self._result_columns = ResultColumns.from_results([])
+        # bumped whenever self.results is replaced, to invalidate _export_cache
+        self._results_rev = 0
+        # dump helper -> (results rev, bytes) from the last export of that kind
+        self._export_cache = {}
         self.filtered_results = []
+        # Per-sort-mode key lists for self.results, built in benchmark_done()
+        self._sort_keys = {}
         self.bench_thread = None
         self.sec_thread = None
-
-        self.setup_ui()
+        self.export_thread = None
+
+        # Latest progress from the worker threads; only the newest value per
+        # frame reaches the widgets, however fast the signals arrive
+        self._pending_progress = None
+        self._pending_sec_progress = None
+        # DNSSEC results queued the same way and added to the tab in one batch
+        self._pending_sec_results = []
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_FLUSH_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # Styles go on first so every widget is polished once, as it is created
         self.apply_styles()
+        self.setup_ui()
 
     def setup_ui(self):
         central = QWidget()
@@ -1039,19 +1663,17 @@ class MainWindow(QMainWindow):
 
         # Header
         header = QWidget()
-        header.setStyleSheet("background-color: #1565C0;")
+        header.setObjectName("header")
         hl = QHBoxLayout(header)
         hl.setContentsMargins(25, 18, 25, 18)
 
         title = QLabel("Bench my DNS")
         title.setFont(QFont("Segoe UI", 26, QFont.Weight.Bold))
-        title.setStyleSheet("color: white; background-color: transparent;")
+        title.setObjectName("headerTitle")
         hl.addWidget(title)
 
         st = QLabel("Find your fastest DNS server")
-        st.setStyleSheet(
-            "color: #E3F2FD; font-size: 14px; background-color: transparent;"
-        )
+        st.setObjectName("headerSubtitle")
         hl.addWidget(st)
         hl.addStretch()
 
@@ -1059,18 +1681,32 @@ class MainWindow(QMainWindow):
 
         # Tabs
         self.tabs = QTabWidget()
-        self.create_run_tab()
-        self.create_results_tab()
-        self.create_security_tab()
+        self.tabs.addTab(self.create_run_tab(), "Run Test")
+        # Results and Security start as empty pages and are built on first use
+        self._tab_builders = {}
+        for builder, title in (
+            (self.create_results_tab, "Results"),
+            (self.create_security_tab, "Security"),
+        ):
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            self._tab_builders[self.tabs.addTab(page, title)] = builder
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
         layout.addWidget(self.tabs)
 
         self.statusBar().showMessage("Ready")
-        self.statusBar().setStyleSheet(
-            "background-color: #424242; color: white; font-size: 12px;"
-        )
+        # status bar progress for exports; created by the first export
+        self.export_prog = None
+
+    def _ensure_tab_built(self, index):
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            self.tabs.widget(index).layout().addWidget(builder())
 
     def apply_styles(self):
-        self.setStyleSheet("""
+        # One application-wide sheet; individual widgets are matched by
+        # objectName or by a "role" property instead of their own stylesheets
+        QApplication.instance().setStyleSheet("""
             QMainWindow { background-color: #FAFAFA; }
             QWidget { background-color: #FAFAFA; font-family: 'Segoe UI'; }
             QGroupBox {
@@ -1233,6 +1869,125 @@ class MainWindow(QMainWindow):
                 min-width: 30px;
             }
             QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0px; }
+
+            /* Header and status bar */
+            QWidget#header { background-color: #1565C0; }
+            QLabel#headerTitle { color: white; background-color: transparent; }
+            QLabel#headerSubtitle {
+                color: #E3F2FD;
+                font-size: 14px;
+                background-color: transparent;
+            }
+            QStatusBar, QStatusBar * {
+                background-color: #424242;
+                color: white;
+                font-size: 12px;
+            }
+            QProgressBar#exportProg {
+                background-color: #616161;
+                max-height: 14px;
+                font-size: 10px;
+            }
+
+            /* Run tab */
+            QLabel[role="sectionTitle"] {
+                font-size: 15px;
+                font-weight: 600;
+                color: #333333;
+                margin-bottom: 8px;
+            }
+            QLabel#settingsTitle { margin-bottom: 12px; }
+            QScrollArea#serverScroll {
+                background-color: white;
+                border: 1px solid #E0E0E0;
+                border-radius: 8px;
+            }
+            QWidget#serverList, QWidget#serverList * { background-color: white; }
+            QPushButton#selectAllBtn, QPushButton#deselectAllBtn {
+                border: none;
+                border-radius: 6px;
+                padding: 8px 16px;
+                font-size: 12px;
+                font-weight: 600;
+            }
+            QPushButton#selectAllBtn { background-color: #E8F5E9; color: #2E7D32; }
+            QPushButton#deselectAllBtn { background-color: #FFEBEE; color: #C62828; }
+            QWidget#settingsCard, QWidget#settingsCard * {
+                background-color: white;
+                border: 1px solid #E0E0E0;
+                border-radius: 8px;
+                padding: 16px;
+            }
+            QWidget#progressCard, QWidget#progressCard * {
+                background-color: white;
+                border: 1px solid #E0E0E0;
+                border-radius: 8px;
+            }
+            QLabel[role="fieldLabel"] { color: #666666; font-size: 13px; }
+            QLabel#progLabel { color: #888888; font-size: 12px; }
+            QPushButton#startBtn {
+                background-color: #4CAF50;
+                color: white;
+                font-size: 15px;
+                font-weight: 700;
+                padding: 14px 32px;
+                border-radius: 8px;
+                border: none;
+            }
+            QPushButton#startBtn:hover { background-color: #388E3C; }
+            QPushButton#startBtn:disabled { background-color: #BDBDBD; color: #9E9E9E; }
+            QLabel#runLegend { color: #888888; font-size: 12px; padding: 8px; }
+
+            /* Results tab */
+            QLabel#summaryLabel {
+                font-size: 16px;
+                font-weight: bold;
+                color: #1565C0;
+                padding: 12px 20px;
+                background-color: #E3F2FD;
+                border-radius: 8px;
+            }
+            QWidget#sortBox, QWidget#sortBox QWidget {
+                background-color: #F5F5F5;
+                border-radius: 8px;
+            }
+            QLabel#sortLabel { font-size: 13px; color: #666666; background: transparent; }
+            QPushButton#exportCsvBtn, QPushButton#exportJsonBtn {
+                color: white;
+                border-radius: 6px;
+                padding: 10px 20px;
+                font-size: 13px;
+                font-weight: bold;
+            }
+            QPushButton#exportCsvBtn { background-color: #4CAF50; }
+            QPushButton#exportCsvBtn:hover { background-color: #388E3C; }
+            QPushButton#exportJsonBtn { background-color: #2196F3; }
+            QPushButton#exportJsonBtn:hover { background-color: #1976D2; }
+            QPushButton#exportCsvBtn:disabled, QPushButton#exportJsonBtn:disabled {
+                background-color: #BDBDBD;
+                color: #9E9E9E;
+            }
+            QScrollArea#resultsScroll {
+                border: 2px solid #E0E0E0;
+                border-radius: 8px;
+                padding: 2px;
+                background-color: white;
+            }
+
+            /* Security tab */
+            QLabel#secTitle { font-size: 20px; font-weight: bold; color: #1565C0; }
+            QLabel#secDesc { color: #616161; font-size: 13px; }
+            QPushButton#secBtn {
+                background-color: #FF6F00;
+                color: white;
+                font-size: 16px;
+                font-weight: bold;
+                padding: 15px 40px;
+                border-radius: 8px;
+                max-width: 300px;
+            }
+            QPushButton#secBtn:hover { background-color: #E65100; }
+            QListView#secList { border: none; padding: 6px 0px; background-color: #FAFAFA; }
         """)
 
     def create_run_tab(self):
@@ -1244,51 +1999,47 @@ class MainWindow(QMainWindow):
         left = QVBoxLayout()
 
         title_label = QLabel("DNS Servers")
-        title_label.setStyleSheet(
-            "font-size: 15px; font-weight: 600; color: #333333; margin-bottom: 8px;"
-        )
+        title_label.setProperty("role", "sectionTitle")
         left.addWidget(title_label)
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setMinimumHeight(350)
-        scroll.setStyleSheet(
-            "QScrollArea { background-color: white; border: 1px solid #E0E0E0; border-radius: 8px; }"
-        )
+        scroll.setObjectName("serverScroll")
 
         container = QWidget()
-        container.setStyleSheet("background-color: white;")
+        container.setObjectName("serverList")
         cl = QVBoxLayout(container)
         cl.setSpacing(6)
         cl.setContentsMargins(12, 10, 12, 10)
 
+        # hold repaints until the whole list is in; one layout pass follows
+        container.setUpdatesEnabled(False)
         self.checkboxes = {}
-        for name, ip in sorted(DNS_SERVERS.items()):
+        for name, ip in _DNS_ITEMS:
             cb = QCheckBox(f"{name}  ({ip})")
             cb.setChecked(True)
             self.checkboxes[name] = cb
             cl.addWidget(cb)
 
         cl.addStretch()
+        container.setUpdatesEnabled(True)
+        # (name, ip, checkbox) in DNS_SERVERS order, for building run selections
+        self._server_triples = [
+            (name, ip, self.checkboxes[name]) for name, ip in DNS_SERVERS
+        ]
+        self._server_list = container
         scroll.setWidget(container)
         left.addWidget(scroll)
 
         bl = QHBoxLayout()
         bl.setSpacing(10)
         sa = QPushButton("Select All")
-        sa.setStyleSheet(
-            "background-color: #E8F5E9; color: #2E7D32; border: none; border-radius: 6px; padding: 8px 16px; font-size: 12px; font-weight: 600;"
-        )
-        sa.clicked.connect(
-            lambda: [c.setChecked(True) for c in self.checkboxes.values()]
-        )
+        sa.setObjectName("selectAllBtn")
+        sa.clicked.connect(lambda: self._set_all_checked(True))
         da = QPushButton("Deselect All")
-        da.setStyleSheet(
-            "background-color: #FFEBEE; color: #C62828; border: none; border-radius: 6px; padding: 8px 16px; font-size: 12px; font-weight: 600;"
-        )
-        da.clicked.connect(
-            lambda: [c.setChecked(False) for c in self.checkboxes.values()]
-        )
+        da.setObjectName("deselectAllBtn")
+        da.clicked.connect(lambda: self._set_all_checked(False))
         bl.addWidget(sa)
         bl.addWidget(da)
         bl.addStretch()
@@ -1300,22 +2051,19 @@ class MainWindow(QMainWindow):
         right = QVBoxLayout()
 
         settings_title = QLabel("Settings")
-        settings_title.setStyleSheet(
-            "font-size: 15px; font-weight: 600; color: #333333; margin-bottom: 12px;"
-        )
+        settings_title.setObjectName("settingsTitle")
+        settings_title.setProperty("role", "sectionTitle")
         right.addWidget(settings_title)
 
         settings_card = QWidget()
-        settings_card.setStyleSheet(
-            "background-color: white; border: 1px solid #E0E0E0; border-radius: 8px; padding: 16px;"
-        )
+        settings_card.setObjectName("settingsCard")
         settings_layout = QVBoxLayout(settings_card)
         settings_layout.setSpacing(14)
         settings_layout.setContentsMargins(16, 16, 16, 16)
 
         q_row = QHBoxLayout()
         q_label = QLabel("Queries per server:")
-        q_label.setStyleSheet("color: #666666; font-size: 13px;")
+        q_label.setProperty("role", "fieldLabel")
         q_row.addWidget(q_label)
         # use ModernSpinWidget (modern arrows, consistent across platforms)
         self.query_spin = ModernSpinWidget(
@@ -1327,7 +2075,7 @@ class MainWindow(QMainWindow):
 
         t_row = QHBoxLayout()
         t_label = QLabel("Timeout (seconds):")
-        t_label.setStyleSheet("color: #666666; font-size: 13px;")
+        t_label.setProperty("role", "fieldLabel")
         t_row.addWidget(t_label)
         # use ModernSpinWidget with floating values
         self.timeout_spin = ModernSpinWidget(
@@ -1339,7 +2087,7 @@ class MainWindow(QMainWindow):
 
         p_row = QHBoxLayout()
         p_label = QLabel("Protocols:")
-        p_label.setStyleSheet("color: #666666; font-size: 13px;")
+        p_label.setProperty("role", "fieldLabel")
         p_row.addWidget(p_label)
         self.udp_check = QCheckBox("UDP")
         self.udp_check.setChecked(True)
@@ -1355,15 +2103,11 @@ class MainWindow(QMainWindow):
         right.addSpacing(16)
 
         progress_title = QLabel("Progress")
-        progress_title.setStyleSheet(
-            "font-size: 15px; font-weight: 600; color: #333333; margin-bottom: 8px;"
-        )
+        progress_title.setProperty("role", "sectionTitle")
         right.addWidget(progress_title)
 
         progress_card = QWidget()
-        progress_card.setStyleSheet(
-            "background-color: white; border: 1px solid #E0E0E0; border-radius: 8px;"
-        )
+        progress_card.setObjectName("progressCard")
         pl = QVBoxLayout(progress_card)
         pl.setContentsMargins(16, 16, 16, 16)
         pl.setSpacing(10)
@@ -1374,7 +2118,7 @@ class MainWindow(QMainWindow):
 
         self.prog_label = QLabel("Ready")
         self.prog_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.prog_label.setStyleSheet("color: #888888; font-size: 12px;")
+        self.prog_label.setObjectName("progLabel")
         pl.addWidget(self.prog_label)
 
         right.addWidget(progress_card)
@@ -1382,31 +2126,26 @@ class MainWindow(QMainWindow):
         right.addSpacing(20)
 
         self.start_btn = QPushButton("START BENCHMARK")
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-size: 15px;
-                font-weight: 700;
-                padding: 14px 32px;
-                border-radius: 8px;
-                border: none;
-            }
-            QPushButton:hover { background-color: #388E3C; }
-            QPushButton:disabled { background-color: #BDBDBD; color: #9E9E9E; }
-        """)
+        self.start_btn.setObjectName("startBtn")
         self.start_btn.clicked.connect(self.start_benchmark)
         right.addWidget(self.start_btn)
 
         legend = QLabel("Green = Cached  |  Red = Uncached  |  Blue = Average")
-        legend.setStyleSheet("color: #888888; font-size: 12px; padding: 8px;")
+        legend.setObjectName("runLegend")
         legend.setAlignment(Qt.AlignmentFlag.AlignCenter)
         right.addWidget(legend)
 
         right.addStretch()
         layout.addLayout(right, 1)
 
-        self.tabs.addTab(tab, "Run Test")
+        return tab
+
+    def _set_all_checked(self, checked):
+        # one repaint of the list instead of one per checkbox
+        self._server_list.setUpdatesEnabled(False)
+        for cb in self.checkboxes.values():
+            cb.setChecked(checked)
+        self._server_list.setUpdatesEnabled(True)
 
     def create_results_tab(self):
         tab = QWidget()
@@ -1415,16 +2154,7 @@ class MainWindow(QMainWindow):
         layout.setSpacing(12)
 
         self.summary_label = QLabel("Run a benchmark to see results")
-        self.summary_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #1565C0;
-                padding: 12px 20px;
-                background-color: #E3F2FD;
-                border-radius: 8px;
-            }
-        """)
+        self.summary_label.setObjectName("summaryLabel")
         layout.addWidget(self.summary_label)
 
         controls = QWidget()
@@ -1436,17 +2166,10 @@ class MainWindow(QMainWindow):
         sort_layout = QHBoxLayout(sort_container)
         sort_layout.setContentsMargins(15, 8, 15, 8)
         sort_layout.setSpacing(10)
-        sort_container.setStyleSheet("""
-            QWidget {
-                background-color: #F5F5F5;
-                border-radius: 8px;
-            }
-        """)
+        sort_container.setObjectName("sortBox")
 
         sort_label = QLabel("Sort by:")
-        sort_label.setStyleSheet(
-            "font-size: 13px; color: #666666; background: transparent;"
-        )
+        sort_label.setObjectName("sortLabel")
         sort_layout.addWidget(sort_label)
 
         # Use our SimpleCombo replacement so we control popup and arrow completely
@@ -1467,54 +2190,28 @@ class MainWindow(QMainWindow):
         sort_layout.addWidget(self.filter_combo)
         controls_layout.addWidget(sort_container)
 
-        export_btn = QPushButton("Export to CSV")
-        export_btn.clicked.connect(self.export_csv)
-        export_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #388E3C; }
-        """)
-        controls_layout.addWidget(export_btn)
+        self.export_btn = QPushButton("Export to CSV")
+        self.export_btn.clicked.connect(self.export_csv)
+        self.export_btn.setObjectName("exportCsvBtn")
+        controls_layout.addWidget(self.export_btn)
 
-        export_json_btn = QPushButton("Export to JSON")
-        export_json_btn.clicked.connect(self.export_json)
-        export_json_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #1976D2; }
-        """)
-        controls_layout.addWidget(export_json_btn)
+        self.export_json_btn = QPushButton("Export to JSON")
+        self.export_json_btn.clicked.connect(self.export_json)
+        self.export_json_btn.setObjectName("exportJsonBtn")
+        controls_layout.addWidget(self.export_json_btn)
 
         controls_layout.addStretch()
         layout.addWidget(controls)
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: 2px solid #E0E0E0;
-                border-radius: 8px;
-                background-color: white;
-            }
-        """)
+        scroll.setObjectName("resultsScroll")
 
         self.chart = ResultsChart()
         scroll.setWidget(self.chart)
         layout.addWidget(scroll, 1)
 
-        self.tabs.addTab(tab, "Results")
+        return tab
 
     def create_security_tab(self):
         tab = QWidget()
@@ -1523,26 +2220,15 @@ class MainWindow(QMainWindow):
         layout.setSpacing(15)
 
         title = QLabel("DNSSEC Security Analysis")
-        title.setStyleSheet("font-size: 20px; font-weight: bold; color: #1565C0;")
+        title.setObjectName("secTitle")
         layout.addWidget(title)
 
         desc = QLabel("Check if your DNS servers support DNSSEC validation")
-        desc.setStyleSheet("color: #616161; font-size: 13px;")
+        desc.setObjectName("secDesc")
         layout.addWidget(desc)
 
         self.sec_btn = QPushButton("Run DNSSEC Check")
-        self.sec_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF6F00;
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 15px 40px;
-                border-radius: 8px;
-                max-width: 300px;
-            }
-            QPushButton:hover { background-color: #E65100; }
-        """)
+        self.sec_btn.setObjectName("secBtn")
         self.sec_btn.clicked.connect(self.run_security)
         layout.addWidget(self.sec_btn, alignment=Qt.AlignmentFlag.AlignCenter)
 
@@ -1551,25 +2237,23 @@ class MainWindow(QMainWindow):
         self.sec_prog.setMaximumWidth(600)
         layout.addWidget(self.sec_prog, alignment=Qt.AlignmentFlag.AlignCenter)
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background-color: #FAFAFA; }")
-
-        self.sec_container = QWidget()
-        self.sec_container.setStyleSheet("background-color: #FAFAFA;")
-        self.sec_layout = QVBoxLayout(self.sec_container)
-        self.sec_layout.setSpacing(8)
-        self.sec_layout.setContentsMargins(10, 10, 10, 10)
-        scroll.setWidget(self.sec_container)
+        # cards are painted by DnssecDelegate straight from the model
+        self.sec_model = DnssecModel(self)
+        self.sec_list = QListView()
+        self.sec_list.setObjectName("secList")
+        self.sec_list.setModel(self.sec_model)
+        self.sec_list.setItemDelegate(DnssecDelegate(self.sec_list))
+        self.sec_list.setUniformItemSizes(True)
+        self.sec_list.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.sec_list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.sec_list.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
 
-        layout.addWidget(scroll, 1)
-        self.tabs.addTab(tab, "Security")
+        layout.addWidget(self.sec_list, 1)
+        return tab
 
     def start_benchmark(self):
         try:
-            servers = {
-                n: ip for n, ip in DNS_SERVERS.items() if self.checkboxes[n].isChecked()
-            }
+            servers = [(n, ip) for n, ip, cb in self._server_triples if cb.isChecked()]
             if not servers:
                 QMessageBox.warning(
                     self, "Warning", "Please select at least one server!"
@@ -1579,6 +2263,8 @@ class MainWindow(QMainWindow):
             self.start_btn.setEnabled(False)
             self.start_btn.setText("Running...")
             self.results = []
+            self._result_columns = ResultColumns.from_results([])
+            self._results_rev += 1
 
             if self.bench_thread and self.bench_thread.isRunning():
                 self.bench_thread.stop()
@@ -1596,29 +2282,70 @@ class MainWindow(QMainWindow):
             self.start_btn.setText("START BENCHMARK")
 
     def update_progress(self, pct, msg):
-        self.progress.setValue(pct)
-        self.prog_label.setText(msg)
-        self.statusBar().showMessage(msg)
+        self._pending_progress = (pct, msg)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def update_sec_progress(self, pct):
+        self._pending_sec_progress = pct
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def queue_security_results(self, results):
+        self._pending_sec_results.extend(results)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        if self._pending_progress is not None:
+            pct, msg = self._pending_progress
+            self._pending_progress = None
+            self.progress.setValue(pct)
+            self.prog_label.setText(msg)
+            self.statusBar().showMessage(msg)
+        if self._pending_sec_progress is not None:
+            self.sec_prog.setValue(self._pending_sec_progress)
+            self._pending_sec_progress = None
+        if self._pending_sec_results:
+            results, self._pending_sec_results = self._pending_sec_results, []
+            self.add_security_results(results)
 
     def benchmark_done(self, results):
+        # apply the final progress now so it can't land on top of the summary
+        self._flush_progress()
         try:
+            # the Results tab may not have been opened yet
+            self._ensure_tab_built(1)
             self.results = results
+            cols = self._result_columns = ResultColumns.from_results(results)
+            self._results_rev += 1
             self.filtered_results = results
+            self._sort_keys = self._build_sort_keys(cols)
             self.start_btn.setEnabled(True)
             self.start_btn.setText("START BENCHMARK")
 
-            if results:
-                valid_results = [r for r in results if r.overall_avg > 0]
-                if valid_results:
-                    best = min(valid_results, key=lambda x: x.overall_avg)
-                    total_q = sum(r.total_queries for r in valid_results)
-                    total_s = sum(r.successful for r in valid_results)
-                    rate = (total_s / total_q * 100) if total_q else 0
-                    self.summary_label.setText(
-                        f"Winner: {best.name} ({best.overall_avg:.1f}ms)  |  "
-                        f"Tested: {len(valid_results)} servers  |  "
-                        f"Success: {rate:.1f}%"
-                    )
+            # one pass over the columns for the winner and the totals
+            best = None
+            best_avg = float("inf")
+            tested = total_q = total_s = 0
+            for i, (overall, queries, successful) in enumerate(
+                zip(cols.overall, cols.total_queries, cols.successful)
+            ):
+                if overall <= 0:
+                    continue
+                if overall < best_avg:
+                    best = results[i]
+                    best_avg = overall
+                tested += 1
+                total_q += queries
+                total_s += successful
+            if best is not None:
+                rate = (total_s / total_q * 100) if total_q else 0
+                self.summary_label.setText(
+                    f"Winner: {best.name} ({best.overall_avg:.1f}ms)  |  "
+                    f"Tested: {tested} servers  |  "
+                    f"Success: {rate:.1f}%"
+                )
 
             self.apply_filter()
             self.tabs.setCurrentIndex(1)
@@ -1630,10 +2357,23 @@ class MainWindow(QMainWindow):
             self.start_btn.setText("START BENCHMARK")
 
     def benchmark_error(self, error_msg):
+        self._flush_progress()
         QMessageBox.critical(self, "Error", f"Benchmark failed: {error_msg}")
         self.start_btn.setEnabled(True)
         self.start_btn.setText("START BENCHMARK")
 
+    @staticmethod
+    def _build_sort_keys(cols):
+        """Extract one key list per sort mode; failed servers sort last."""
+        inf = float("inf")
+        return {
+            0: ([v if v > 0 else inf for v in cols.cached], False),
+            1: ([v if v > 0 else inf for v in cols.uncached], False),
+            2: ([v if v > 0 else inf for v in cols.overall], False),
+            3: ([v if v > 0 else 0 for v in cols.overall], True),
+            4: (cols.reliability, True),
+        }
+
     def apply_filter(self):
         try:
             if not self.results:
@@ -1641,43 +2381,18 @@ class MainWindow(QMainWindow):
 
             sort_mode = self.filter_combo.currentIndex()
 
-            if sort_mode == 0:
-                self.filtered_results = sorted(
-                    self.results,
-                    key=lambda x: x.cached_avg if x.cached_avg > 0 else float("inf"),
-                )
-            elif sort_mode == 1:
-                self.filtered_results = sorted(
-                    self.results,
-                    key=lambda x: x.uncached_avg
-                    if x.uncached_avg > 0
-                    else float("inf"),
-                )
-            elif sort_mode == 2:
-                self.filtered_results = sorted(
-                    self.results,
-                    key=lambda x: x.overall_avg if x.overall_avg > 0 else float("inf"),
-                )
-            elif sort_mode == 3:
-                self.filtered_results = sorted(
-                    self.results,
-                    key=lambda x: x.overall_avg if x.overall_avg > 0 else 0,
-                    reverse=True,
-                )
-            elif sort_mode == 4:
-                self.filtered_results = sorted(
-                    self.results, key=lambda x: x.reliability, reverse=True
-                )
+            if sort_mode in self._sort_keys:
+                keys, reverse = self._sort_keys[sort_mode]
+                order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+                self.filtered_results = [self.results[i] for i in order]
 
             self.chart.set_results(self.filtered_results)
         except Exception as e:
-            print(f"Filter error: {e}")
+            log.debug("Filter error: %s", e)
 
     def run_security(self):
         try:
-            servers = {
-                n: ip for n, ip in DNS_SERVERS.items() if self.checkboxes[n].isChecked()
-            }
+            servers = [(n, ip) for n, ip, cb in self._server_triples if cb.isChecked()]
             if not servers:
                 QMessageBox.warning(
                     self, "Warning", "Please select at least one server!"
@@ -1686,22 +2401,16 @@ class MainWindow(QMainWindow):
 
             self.sec_btn.setEnabled(False)
             self.sec_prog.setValue(0)
-
-            while self.sec_layout.count():
-                child = self.sec_layout.takeAt(0)
-                if child and child.widget():
-                    child.widget().setParent(None)
-                    child.widget().deleteLater()
-
-            QApplication.processEvents()
+            self._pending_sec_results = []
+            self.sec_model.clear()
 
             if self.sec_thread and self.sec_thread.isRunning():
                 self.sec_thread.stop()
                 self.sec_thread.wait(2000)
 
             self.sec_thread = SecurityThread(servers)
-            self.sec_thread.progress.connect(self.sec_prog.setValue)
-            self.sec_thread.result.connect(self.add_security_result)
+            self.sec_thread.progress.connect(self.update_sec_progress)
+            self.sec_thread.results.connect(self.queue_security_results)
             self.sec_thread.finished_signal.connect(self.security_done)
             self.sec_thread.start()
 
@@ -1709,69 +2418,15 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Security check failed: {str(e)}")
             self.sec_btn.setEnabled(True)
 
-    def add_security_result(self, name, status):
+    def add_security_results(self, results):
         try:
-            card = QFrame()
-            card.setFrameShape(QFrame.Shape.StyledPanel)
-            card.setMinimumHeight(50)
-            card.setStyleSheet("""
-                QFrame {
-                    background-color: white;
-                    border: 2px solid #E0E0E0;
-                    border-radius: 8px;
-                }
-            """)
-
-            hlayout = QHBoxLayout(card)
-            hlayout.setContentsMargins(20, 12, 20, 12)
-
-            name_label = QLabel(name)
-            name_label.setStyleSheet(
-                "font-size: 15px; font-weight: bold; color: #000000; background-color: transparent; border: none;"
-            )
-            hlayout.addWidget(name_label)
-            hlayout.addStretch()
-
-            ip_text = DNS_SERVERS.get(name, "")
-            if ip_text:
-                ip_label = QLabel(ip_text)
-                ip_label.setStyleSheet(
-                    "font-size: 12px; color: #757575; background-color: transparent; border: none; margin-right: 20px;"
-                )
-                hlayout.addWidget(ip_label)
-
-            status_label = QLabel()
-            status_label.setMinimumWidth(140)
-            if status == "valid":
-                status_label.setText("DNSSEC Valid")
-                status_label.setStyleSheet(
-                    "color: #2E7D32; font-weight: bold; font-size: 14px; background-color: transparent; border: none;"
-                )
-            elif status == "signed":
-                status_label.setText("Signed")
-                status_label.setStyleSheet(
-                    "color: #F57C00; font-weight: bold; font-size: 14px; background-color: transparent; border: none;"
-                )
-            elif status == "unsigned":
-                status_label.setText("No DNSSEC")
-                status_label.setStyleSheet(
-                    "color: #C62828; font-weight: bold; font-size: 14px; background-color: transparent; border: none;"
-                )
-            else:
-                status_label.setText("Error")
-                status_label.setStyleSheet(
-                    "color: #757575; font-weight: bold; font-size: 14px; background-color: transparent; border: none;"
-                )
-
-            hlayout.addWidget(status_label)
-            self.sec_layout.addWidget(card)
-            card.show()
-            self.sec_container.update()
+            self.sec_model.add_results(results)
 
         except Exception as e:
-            print(f"Error adding security result: {e}")
+            log.debug("Error adding security result: %s", e)
 
     def security_done(self):
+        self._flush_progress()
         self.sec_btn.setEnabled(True)
 
     def export_csv(self):
@@ -1784,37 +2439,12 @@ class MainWindow(QMainWindow):
                 self, "Export", "dns_results.csv", "CSV (*.csv)"
             )
             if filename:
-                with open(filename, "w", newline="") as f:
-                    writer = csv.writer(f)
-                    writer.writerow(
-                        [
-                            "Server",
-                            "IP",
-                            "Cached_ms",
-                            "Uncached_ms",
-                            "Avg_ms",
-                            "Reliability_%",
-                        ]
-                    )
-                    for r in self.results:
-                        writer.writerow(
-                            [
-                                r.name,
-                                r.ip,
-                                r.cached_avg,
-                                r.uncached_avg,
-                                r.overall_avg,
-                                r.reliability,
-                            ]
-                        )
-                QMessageBox.information(self, "Done", f"Results saved to {filename}")
+                self._start_export(_dump_results_csv, filename)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Export failed: {str(e)}")
 
     def export_json(self):
         try:
-            import json
-
             if not self.results:
                 QMessageBox.warning(self, "Warning", "No results to export!")
                 return
@@ -1823,24 +2453,49 @@ class MainWindow(QMainWindow):
                 self, "Export", "dns_results.json", "JSON (*.json)"
             )
             if filename:
-                data = []
-                for r in self.results:
-                    data.append(
-                        {
-                            "server": r.name,
-                            "ip": r.ip,
-                            "cached_ms": round(r.cached_avg, 2),
-                            "uncached_ms": round(r.uncached_avg, 2),
-                            "average_ms": round(r.overall_avg, 2),
-                            "reliability_percent": round(r.reliability, 1),
-                        }
-                    )
-                with open(filename, "w") as f:
-                    json.dump(data, f, indent=2)
-                QMessageBox.information(self, "Done", f"Results saved to {filename}")
+                self._start_export(_dump_results_json, filename)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Export failed: {str(e)}")
 
+    def _start_export(self, dump, filename):
+        # serializing and writing happen in the thread; the GUI keeps painting
+        self.export_btn.setEnabled(False)
+        self.export_json_btn.setEnabled(False)
+        # results unchanged since the last export of this kind: reuse its bytes
+        rev, data = self._export_cache.get(dump, (None, None))
+        if rev != self._results_rev:
+            data = None
+        self.export_thread = ExportThread(
+            dump, filename, self._result_columns, data
+        )
+        # the rev the thread's snapshot belongs to, for export_done
+        self._export_rev = self._results_rev
+        self.export_thread.finished_signal.connect(self.export_done)
+        self.export_thread.error_signal.connect(self.export_error)
+        if self.export_prog is None:
+            self.export_prog = QProgressBar()
+            self.export_prog.setObjectName("exportProg")
+            self.export_prog.setMaximumWidth(200)
+            self.statusBar().addPermanentWidget(self.export_prog)
+        self.export_prog.setValue(0)
+        self.export_prog.show()
+        self.export_thread.progress.connect(self.export_prog.setValue)
+        self.export_thread.start()
+
+    def export_done(self, filename):
+        self.export_btn.setEnabled(True)
+        self.export_json_btn.setEnabled(True)
+        self.export_prog.hide()
+        thread = self.export_thread
+        self._export_cache[thread.dump] = (self._export_rev, thread.data)
+        QMessageBox.information(self, "Done", f"Results saved to {filename}")
+
+    def export_error(self, error_msg):
+        self.export_btn.setEnabled(True)
+        self.export_json_btn.setEnabled(True)
+        self.export_prog.hide()
+        QMessageBox.critical(self, "Error", f"Export failed: {error_msg}")
+
     def closeEvent(self, a0):
         if self.bench_thread and self.bench_thread.isRunning():
             self.bench_thread.stop()
@@ -1848,6 +2503,9 @@ class MainWindow(QMainWindow):
         if self.sec_thread and self.sec_thread.isRunning():
             self.sec_thread.stop()
             self.sec_thread.wait(2000)
+        if self.export_thread and self.export_thread.isRunning():
+            # let the write finish rather than leave a truncated file
+            self.export_thread.wait()
         a0.accept()
 
 
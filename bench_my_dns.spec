@@ -0,0 +1,55 @@
+# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec for the modern desktop build; run through build_modern.py.
+# Keeping the options here (instead of regenerating them on every build) lets
+# PyInstaller reuse its analysis from build/ between runs.
+import sys
+
+from PyInstaller.utils.hooks import collect_submodules
+
+# stripping symbols only helps (and only works reliably) on Linux
+strip = sys.platform.startswith("linux")
+
+a = Analysis(
+    ["bench_my_dns.py"],
+    pathex=[],
+    binaries=[],
+    datas=[],
+    # PyQt6 is covered by PyInstaller's own hooks; dnspython loads its
+    # rdata modules dynamically, so collect the whole package
+    hiddenimports=collect_submodules("dns"),
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=["tkinter", "unittest", "pydoc", "test"],
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+
+# one-folder build: nothing to unpack to a temp dir at startup, and no UPX
+# decompression at load time
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name="DNS_Benchmark_Modern_v9",
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=strip,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=strip,
+    upx=False,
+    upx_exclude=[],
+    name="DNS_Benchmark_Modern_v9",
+)
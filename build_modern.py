@@ -20,24 +20,11 @@ def build():
     print("  - Better data presentation")
     print()
 
-    args = [
-        "bench_my_dns_fixed.py",
-        "--name=DNS_Benchmark_Modern_v9",
-        "--onefile",
-        "--windowed",
-        "--clean",
-        "--noconfirm",
-        "--hidden-import=dns.resolver",
-        "--hidden-import=dns.query",
-        "--hidden-import=dns.message",
-        "--hidden-import=dns.rdatatype",
-        "--hidden-import=dns.dnssec",
-        "--hidden-import=aiohttp",
-        "--hidden-import=PyQt6",
-        "--hidden-import=PyQt6.QtCore",
-        "--hidden-import=PyQt6.QtGui",
-        "--hidden-import=PyQt6.QtWidgets",
-    ]
+    # all build options live in the spec, so PyInstaller can reuse the
+    # previous analysis; pass --release for a clean build from scratch
+    args = ["bench_my_dns.spec", "--noconfirm"]
+    if "--release" in sys.argv[1:]:
+        args.append("--clean")
 
     PyInstaller.__main__.run(args)
 
@@ -47,7 +34,8 @@ def build():
     print("=" * 70)
     print()
     print("Your modern DNS Benchmark is at:")
-    print("  dist/DNS_Benchmark_Modern_v9.exe")
+    print("  dist/DNS_Benchmark_Modern_v9/DNS_Benchmark_Modern_v9.exe")
+    print("Ship the whole dist/DNS_Benchmark_Modern_v9 folder (zip or installer).")
     print()
     print("This version features:")
     print("  ✓ Clean, modern UI")
@@ -0,0 +1,4 @@
+import os
+
+# the GUI tests need no display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
@@ -0,0 +1,96 @@
+import json
+import unittest
+from unittest import mock
+
+import bench_my_dns
+from bench_my_dns import (
+    ResultColumns,
+    ServerResult,
+    _dump_results_csv,
+    _dump_results_json,
+)
+
+# a server whose queries all failed keeps the dataclass's int 0 defaults
+FAILED = ServerResult(name="Down", ip="192.0.2.1", total_queries=10)
+OK = ServerResult(
+    name="Up",
+    ip="192.0.2.2",
+    cached_avg=1.234,
+    uncached_avg=20.5,
+    overall_avg=10.867,
+    reliability=90.0,
+    total_queries=10,
+    successful=9,
+)
+
+EXPECTED_JSON = b"""[
+  {
+    "server": "Down",
+    "ip": "192.0.2.1",
+    "cached_ms": 0,
+    "uncached_ms": 0,
+    "average_ms": 0,
+    "reliability_percent": 0
+  },
+  {
+    "server": "Up",
+    "ip": "192.0.2.2",
+    "cached_ms": 1.23,
+    "uncached_ms": 20.5,
+    "average_ms": 10.87,
+    "reliability_percent": 90.0
+  }
+]"""
+
+EXPECTED_CSV = (
+    b"Server,IP,Cached_ms,Uncached_ms,Avg_ms,Reliability_%\r\n"
+    b"Down,192.0.2.1,0.00,0.00,0.00,0.0\r\n"
+    b"Up,192.0.2.2,1.23,20.50,10.87,90.0\r\n"
+)
+
+
+def _reference_json(results):
+    # the export as it was first written: round() into dicts, then json.dumps
+    return json.dumps(
+        [
+            {
+                "server": r.name,
+                "ip": r.ip,
+                "cached_ms": round(r.cached_avg, 2),
+                "uncached_ms": round(r.uncached_avg, 2),
+                "average_ms": round(r.overall_avg, 2),
+                "reliability_percent": round(r.reliability, 1),
+            }
+            for r in results
+        ],
+        indent=2,
+    ).encode()
+
+
+class ExportTest(unittest.TestCase):
+    results = [FAILED, OK]
+
+    def test_json_without_orjson(self):
+        cols = ResultColumns.from_results(self.results)
+        with mock.patch.object(bench_my_dns, "orjson", None):
+            data = _dump_results_json(cols)
+        self.assertEqual(data, EXPECTED_JSON)
+        self.assertEqual(data, _reference_json(self.results))
+
+    @unittest.skipIf(bench_my_dns.orjson is None, "orjson not installed")
+    def test_json_with_orjson(self):
+        cols = ResultColumns.from_results(self.results)
+        self.assertEqual(_dump_results_json(cols), EXPECTED_JSON)
+
+    def test_json_empty(self):
+        cols = ResultColumns.from_results([])
+        with mock.patch.object(bench_my_dns, "orjson", None):
+            self.assertEqual(_dump_results_json(cols), b"[]")
+
+    def test_csv(self):
+        cols = ResultColumns.from_results(self.results)
+        self.assertEqual(_dump_results_csv(cols), EXPECTED_CSV)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from PyQt6.QtWidgets import QApplication
+
+from bench_my_dns import PopupList
+
+app = QApplication.instance() or QApplication([])
+
+
+class PopupListTest(unittest.TestCase):
+    ITEMS = ["Average (fastest first)", "Cached", "Uncached", "Reliability"]
+
+    def test_font_change_remeasures_same_items(self):
+        popup = PopupList()
+        popup.addItems(self.ITEMS)
+        font = popup.font()
+        font.setPointSize(font.pointSize() * 3)
+        popup.setFont(font)
+        # a paint rebuilds the font metrics before the next addItems()
+        popup.grab()
+        popup.addItems(self.ITEMS)
+
+        fresh = PopupList()
+        fresh.setFont(font)
+        fresh.addItems(self.ITEMS)
+        self.assertEqual(popup.minimumWidth(), fresh.minimumWidth())
+
+
+if __name__ == "__main__":
+    unittest.main()